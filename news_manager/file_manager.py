@@ -119,7 +119,7 @@ class FileManager:
                 for enlace in enlaces:
                     f.write(f"{enlace}\n")
         
-        logger.info(f"News saved to: {file_path}")
+        logger.info("News saved to: %s", file_path)
         return file_path
     
     def _save_bluesky_file(self, bluesky_content: str, input_text: str) -> Optional[Path]:
@@ -162,7 +162,7 @@ class FileManager:
         with open(file_path, 'w', encoding='utf-8') as f:
             f.write(bluesky_content + '\n')
 
-        logger.info(f"Bluesky content saved to: {file_path}")
+        logger.info("Bluesky content saved to: %s", file_path)
         return file_path
 
     def _generate_bluesky_slug(self, content: str) -> str:
@@ -4,6 +4,7 @@ News generation module for News Manager.
 This module handles the core logic for generating news articles from input content.
 """
 
+import functools
 import os
 import re
 import unicodedata
@@ -19,6 +20,37 @@ from .validators import InputValidator
 
 logger = logging.getLogger(__name__)
 
+# Instructions for Bluesky-only generation; only the trailing URL varies
+_BLUESKY_PROMPT_TEMPLATE = (
+    'Generate only a short post (maximum 300 characters) for the Bluesky social network, '
+    'with a neutral and informative tone, mentioning the protagonists with only one surname, '
+    'the date (you can abbreviate it as dd/mm hh; if it is an hour on the dot you do not need '
+    'to put the :00)) and the place (for example, abc seminar in xyz) '
+    'if it is a thesis follow the scheme: "PhD Thesis of [Name] [Surname], [dd]/[m] [hh]h, '
+    '[local] the defense of the thesis "[Title]" will take place '
+    'and ending with the link to the news: {url}'
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _bluesky_prompt(url: str) -> str:
+    """Return the Bluesky-only prompt specialized for the given URL."""
+    return _BLUESKY_PROMPT_TEMPLATE.format(url=url)
+
+
+# Line boundaries recognised by str.splitlines(); a CRLF pair just yields an
+# extra empty line, which the parser skips
+_LINE_END_RE = re.compile(r'[\r\n\v\f\x1c-\x1e\x85\u2028\u2029]')
+
+
+# Section headers of the LLM output and the field each one fills
+_OUTPUT_HEADERS = (
+    ('Title:', 'titulo'),
+    ('Text:', 'texto'),
+    ('Links:', 'enlaces'),
+    ('Bluesky:', 'bluesky'),
+)
+
 
 # NewsGenerationError removed - using specific exceptions from exceptions.py
 
@@ -114,13 +146,8 @@ class NewsGenerator:
             ContentProcessingError: If file reading fails
         """
         try:
-            # Use validators for comprehensive file validation
-            InputValidator.validate_file_path(file_path, must_exist=True, must_be_readable=True)
-            InputValidator.validate_file_content(file_path, min_length=10)
-            
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-            
+            # Validate and read the file in a single open/fstat/read pass
+            content, _ = InputValidator.open_and_validate(file_path, min_length=10)
             return content
             
         except (ValidationError, FileOperationError) as e:
@@ -171,15 +198,7 @@ class NewsGenerator:
         """
         logger.info("Generating Bluesky-only content for DIIS URL")
         
-        bluesky_prompt = (
-            'Generate only a short post (maximum 300 characters) for the Bluesky social network, '
-            'with a neutral and informative tone, mentioning the protagonists with only one surname, '
-            'the date (you can abbreviate it as dd/mm hh; if it is an hour on the dot you do not need '
-            'to put the :00)) and the place (for example, abc seminar in xyz) '
-            'if it is a thesis follow the scheme: "PhD Thesis of [Name] [Surname], [dd]/[m] [hh]h, '
-            '[local] the defense of the thesis "[Title]" will take place '
-            'and ending with the link to the news: ' + url
-        )
+        bluesky_prompt = _bluesky_prompt(url)
         
         generated_text = self.llm_client.generate_news(content, bluesky_prompt, url)
         _, _, bluesky, _ = self._parse_output(generated_text)
@@ -209,38 +228,59 @@ class NewsGenerator:
         """
         titulo = texto = bluesky = None
         enlaces = []
-        lines = generated_text.splitlines()
-        buffer = []
+        # The text section is tracked by offsets and sliced once at the end
+        text_start = text_end = None
         mode = None
 
-        for line in lines:
-            line = line.strip()
+        n = len(generated_text)
+        pos = 0
+        while pos < n:
+            match = _LINE_END_RE.search(generated_text, pos)
+            eol = match.start() if match else n
+            line_start, pos = pos, eol + 1
+            line = generated_text[line_start:eol].strip()
+
             if not line:  # Skip empty lines
                 continue
 
-            if line.startswith('Title:'):
-                titulo = line.replace('Title:', '').strip()
+            for header, section in _OUTPUT_HEADERS:
+                if line.startswith(header):
+                    break
+            else:
+                section = None
+
+            if section is None:
+                if mode == 'enlaces' and line.startswith('-'):
+                    enlaces.append(line)
+                continue
+
+            if mode == 'texto':
+                text_end = line_start
+            # The line is already stripped on the right, slicing the header
+            # off only needs an lstrip
+            rest = line[len(header):].lstrip()
+            if section == 'titulo':
+                titulo = rest
                 mode = None
-            elif line.startswith('Text:'):
+            elif section == 'texto':
                 mode = 'texto'
-                buffer = []
-                # Check if there's text on the same line after "Texto:"
-                text_part = line.replace('Text:', '').strip()
-                if text_part:
-                    buffer.append(text_part)
-            elif line.startswith('Links:'):
+                # Text may start on the same line after "Text:"
+                text_start = generated_text.find(header, line_start) + len(header)
+                text_end = None
+            elif section == 'enlaces':
                 mode = 'enlaces'
                 enlaces = []
-            elif line.startswith('Bluesky:'):
-                bluesky = line.replace('Bluesky:', '').strip()
+            else:
+                bluesky = rest
                 mode = None
-            elif mode == 'texto':
-                buffer.append(line)
-            elif mode == 'enlaces' and line.startswith('-'):
-                enlaces.append(line)
 
-        if buffer:
-            texto = '\n'.join(buffer).strip()
+        if text_start is not None:
+            if text_end is None:
+                text_end = n
+            # Same lines as the section sweep: stripped (which also drops the
+            # '\r' of CRLF output), with empty ones skipped
+            lines = generated_text[text_start:text_end].splitlines()
+            texto = '\n'.join(filter(None, (line.strip() for line in lines))) or None
 
         return titulo, texto, bluesky, enlaces
 
@@ -259,7 +299,7 @@ class NewsGenerator:
         
         # Validate URL format
         if not self._is_valid_url(url):
-            logger.warning(f"Invalid URL format: {url}")
+            logger.warning("Invalid URL format: %s", url)
             return text  # Return original text without replacement
             
         # Define possible placeholders
@@ -343,26 +383,44 @@ def siguiente_laborable(fecha: date) -> date:
     return siguiente
 
 
+@functools.lru_cache(maxsize=256)
+def _ascii_fold(text: str) -> str:
+    """Fold text to ASCII by stripping accents (NFKD decomposition)."""
+    return unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+
+
+# Name patterns run on ASCII-folded text, so plain bounded ASCII classes suffice
+_NAME = r'[A-Z][a-z]{1,30}'
+_PERSON_NAME_PATTERNS = [
+    re.compile(rf'\b(?:Dr\.|Dra\.|Prof\.|Profesora)\s+({_NAME}(?:\s+{_NAME})*)\b', re.ASCII),
+    re.compile(rf'\b({_NAME})\s+(?:y|e)\s+({_NAME})\b', re.ASCII),
+    re.compile(rf'\b({_NAME})\s+({_NAME})\b', re.ASCII),
+    re.compile(rf'\b(?:el|la)\s+({_NAME})\s+({_NAME})\b', re.ASCII),
+]
+
+
 def extract_person_names(text: str) -> List[str]:
     """
     Extract person names from text using common patterns.
     
+    The text is folded to ASCII first, so names are returned without accents.
+    
     Args:
         text: Text to extract names from
         
     Returns:
         List of extracted names
     """
-    patterns = [
-        r'\b(?:Dr\.|Dra\.|Prof\.|Profesora)\s+([A-ZÁÉÍÓÚÜÑ][a-záéíóúüñ]+(?:\s+[A-ZÁÉÍÓÚÜÑ][a-záéíóúüñ]+)*)\b',
-        r'\b([A-ZÁÉÍÓÚÜÑ][a-záéíóúüñ]+)\s+(?:y|e)\s+([A-ZÁÉÍÓÚÜÑ][a-záéíóúüñ]+)\b',
-        r'\b([A-ZÁÉÍÓÚÜÑ][a-záéíóúüñ]+)\s+([A-ZÁÉÍÓÚÜÑ][a-záéíóúüñ]+)\b',
-        r'\b(?:el|la)\s+([A-ZÁÉÍÓÚÜÑ][a-záéíóúüñ]+)\s+([A-ZÁÉÍÓÚÜÑ][a-záéíóúüñ]+)\b'
-    ]
+    # Every pattern needs an uppercase letter; str.islower() rules that out
+    # in a single C-level pass without running any regex
+    if not text or text.islower():
+        return []
+
+    text = _ascii_fold(text)
 
     names = set()
-    for pattern in patterns:
-        matches = re.findall(pattern, text, re.U)
+    for pattern in _PERSON_NAME_PATTERNS:
+        matches = pattern.findall(text)
         for match in matches:
             if isinstance(match, tuple):
                 for name in match:
@@ -387,7 +445,7 @@ def slugify(text: str, max_words: int = 4, person_names: Optional[List[str]] = N
     Returns:
         Generated slug
     """
-    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    text = _ascii_fold(text)
     text = re.sub(r'[^\w\s-]', '', text.lower())
     words = text.split()
 
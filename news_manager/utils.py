@@ -1,5 +1,6 @@
 from pathlib import Path
 import logging
+import sys
 
 try:
     from socialModules import moduleRules
@@ -14,22 +15,29 @@ def select_from_list(options, identifier="", selector="", default=""):
     """
     Presents a list of options to the user and returns the selected option.
     """
-    for i, option in enumerate(options):
-        print(f"{i}) {option}")
+    if options:
+        sys.stdout.write('\n'.join(f"{i}) {option}" for i, option in enumerate(options)) + '\n')
+
+    # Lowercase once; the retry loop below only compares against this index
+    lower_options = [option.lower() for option in options]
+    num_options = len(options)
 
     while True:
         try:
             selection = input("Select an option: ")
-            if selection.isdigit():
+            # Dispatch on the first character before scanning the whole input
+            first = selection[:1]
+            if first.isdigit() and selection.isdigit():
                 selection = int(selection)
-                if 0 <= selection < len(options):
+                if 0 <= selection < num_options:
                     return selection, options[selection]
-            elif selection.startswith('http'):
-                return len(options)-1, selection
+            elif first == 'h' and selection.startswith('http'):
+                return num_options-1, selection
             else:
-                for i, option in enumerate(options):
-                    if selection.lower() in option.lower():
-                        return i, option
+                lower_selection = selection.lower()
+                for i, lower_option in enumerate(lower_options):
+                    if lower_selection in lower_option:
+                        return i, options[i]
         except (ValueError, IndexError):
             pass
         except (KeyboardInterrupt, EOFError):
@@ -62,6 +70,33 @@ def get_content_from_web(url=None):
 # Constants
 optionWebName = "Web (An URL is ok) "
 
+# Rules are expensive to build (they read the socialModules configuration),
+# so they are built once per process and reused.
+_RULES_CACHE = None
+_SELECTED_RULES_CACHE = {}
+
+
+def _get_rules():
+    """
+    Returns the cached moduleRules instance, building it on first use.
+    """
+    global _RULES_CACHE
+    if _RULES_CACHE is None:
+        rules = moduleRules.moduleRules()
+        rules.checkRules()
+        _RULES_CACHE = rules
+    return _RULES_CACHE
+
+
+def _select_rules(rules, api_src_types):
+    """
+    Returns the rules matching the given source types, cached by type tuple.
+    """
+    key = tuple(api_src_types)
+    if key not in _SELECTED_RULES_CACHE:
+        _SELECTED_RULES_CACHE[key] = rules.selectRule(list(key), "")
+    return _SELECTED_RULES_CACHE[key]
+
 def select_news_source():
     """
     Presents a unified menu to select the news source (email accounts or web).
@@ -84,12 +119,11 @@ def select_news_source():
 
     if SOCIALMODULES_AVAILABLE:
         try:
-            rules = moduleRules.moduleRules()
-            rules.checkRules()
+            rules = _get_rules()
 
             # Get all available email accounts (gmail and imap)
             api_src_types = ["gmail", "imap"]
-            all_rules = rules.selectRule(api_src_types, "")
+            all_rules = _select_rules(rules, api_src_types)
 
             for source_name in all_rules:
                 source_details = rules.more.get(source_name, {})
@@ -101,8 +135,6 @@ def select_news_source():
             print(f"Warning: Could not load email sources: {e}")
 
     # Add web option at the end
-    optionWebName = "Web (An URL is ok) "
-
     sources.append(optionWebName)
 
     if not sources or (len(sources) == 1 and sources[0] == optionWebName):
@@ -135,7 +167,7 @@ def select_news_source():
         source_name, source_details = email_sources[sel]
 
         # Initialize the API source
-        rules = moduleRules.moduleRules()
+        rules = _get_rules()
         api_src = rules.readConfigSrc("", source_name, source_details)
 
         if not api_src or not api_src.getClient():
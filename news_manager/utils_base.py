@@ -2,9 +2,12 @@ import click
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 LOGDIR = ""
 
+logger = logging.getLogger(__name__)
+
 # --- File I/O ---
 def write_file(filename, content):
     """Writes content to a file.
@@ -14,12 +17,29 @@ def write_file(filename, content):
         content (str): The content to write.
     """
     try:
-        with open(filename, "w") as file:
-            file.write(content)
-        logging.info(f"File written: {filename}")
+        data = content.encode("utf-8")
+        fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+        finally:
+            os.close(fd)
+        logger.info("File written: %s", filename)
     except Exception as e:
-        logging.error(f"Error writing file {filename}: {e}")
+        logger.error("Error writing file %s: %s", filename, e)
+
+
+def write_files(pairs, max_workers=4):
+    """Writes several files concurrently.
 
+    Args:
+        pairs (list): (filename, content) tuples to write.
+        max_workers (int): Maximum number of writer threads.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(lambda pair: write_file(*pair), pairs))
 
 
 def setup_logging(log_dir=None):
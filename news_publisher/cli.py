@@ -1,4 +1,5 @@
 import os
+import sys
 from pathlib import Path
 import click
 from configparser import ConfigParser
@@ -6,19 +7,35 @@ from dotenv import load_dotenv
 import subprocess
 import re
 import tempfile
+from functools import lru_cache
 from news_manager.utils_base import setup_logging
 
+_URL_RE = re.compile(r'https?://\S+')
+
+@lru_cache(maxsize=8)
+def _load_bluesky_config(path, mtime):
+    # mtime is part of the cache key so edits to the file are picked up
+    parser = ConfigParser()
+    parser.read(path)
+    return parser
+
+def _bluesky_config(path):
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        mtime = None
+    return _load_bluesky_config(path, mtime)
+
 def edit_content_in_editor(initial_content):
     editor = os.environ.get('EDITOR', 'vi')
-    with tempfile.NamedTemporaryFile(suffix='.tmp', mode='w+', delete=False, encoding='utf-8') as tf:
+    with tempfile.NamedTemporaryFile(suffix='.tmp', mode='w', delete=False, encoding='utf-8') as tf:
         tf.write(initial_content)
-        tf.flush()
         temp_path = tf.name
-    subprocess.call([editor, temp_path])
-    with open(temp_path, 'r', encoding='utf-8') as tf:
-        edited_content = tf.read().strip()
-    os.unlink(temp_path)
-    return edited_content
+    try:
+        subprocess.call([editor, temp_path], close_fds=False)
+        return Path(temp_path).read_text(encoding='utf-8').strip()
+    finally:
+        os.unlink(temp_path)
 
 def publish_content(content, user):
     if not content:
@@ -28,15 +45,20 @@ def publish_content(content, user):
         click.echo('\n--- Contenido a publicar en Bluesky ---')
         click.echo(content)
         click.echo('--------------------------------------')
-        if click.confirm('¿Quieres publicar este contenido en Bluesky?', default=False):
+        choice = click.prompt('¿Publicar (p), editar (e) o cancelar (c)?',
+                              type=click.Choice(['p', 'e', 'c']), default='c')
+        if choice == 'p':
             break
+        if choice == 'c':
+            click.echo('Publicación cancelada.')
+            return
         click.echo('Abriendo editor para modificar el contenido...')
         content = edit_content_in_editor(content)
         if not content:
             click.echo('El contenido editado está vacío. Cancelando publicación.')
             sys.exit(1)
 
-    urls = re.findall(r'https?://\S+', content)
+    urls = _URL_RE.findall(content)
     link = ""
     text = content
     if urls:
@@ -45,8 +67,7 @@ def publish_content(content, user):
 
     if not user:
         config_path = os.path.expanduser('~/.mySocial/config/.rssBlsk')
-        parser = ConfigParser()
-        parser.read(config_path)
+        parser = _bluesky_config(config_path)
         if not parser.sections():
             click.echo('No se encontró ningún perfil en ~/.mySocial/config/.rssBlsk', err=True)
             sys.exit(1)
@@ -65,11 +86,17 @@ def publish_bluesky(directory, user):
     load_dotenv()
     default_dir = os.getenv('BLUESKY_POSTS_DIR', '.')
     search_dir = directory or default_dir
-    files = sorted(Path(search_dir).glob('*_blsky.txt'), key=lambda p: p.stat().st_mtime, reverse=True)
-    if not files:
+    # DirEntry caches the file type and stat data from the directory read
+    try:
+        with os.scandir(search_dir) as it:
+            entries = [e for e in it if e.name.endswith('_blsky.txt') and e.is_file(follow_symlinks=False)]
+    except OSError:  # missing, not a directory or unreadable
+        entries = []
+    if not entries:
         click.echo(f'No se encontró ningún archivo *_blsky.txt en el directorio {search_dir}.', err=True)
         sys.exit(1)
-    last_file = files[0]
+    latest = max(entries, key=lambda e: e.stat().st_mtime)
+    last_file = Path(latest.path)
     click.echo(f'Archivo a publicar: {last_file}')
     with open(last_file, 'r', encoding='utf-8') as f:
         content = f.read().strip()
@@ -1,10 +1,12 @@
+from pathlib import Path
+
 from setuptools import setup, find_packages
 
 setup(
     name='news-manager',
     version='0.1.0',
     description='A CLI tool for generating news articles using Google Gemini API',
-    long_description=open('README.md').read(),
+    long_description=Path(__file__).with_name('README.md').read_text(encoding='utf-8'),
     long_description_content_type='text/markdown',
     author='Fernando Tricas García',
     author_email='fernand0@gmail.com',
@@ -16,6 +18,7 @@ setup(
         'google-generativeai',
         'requests',
         'beautifulsoup4',
+        'selectolax',
         'python-dotenv',
     ],
     entry_points={
@@ -3,27 +3,25 @@
 Test script for the Bluesky history functionality.
 """
 
+import tempfile
 from pathlib import Path
 from news_manager.bluesky_history import BlueskyHistoryManager
 
-def test_bluesky_history():
+def test_bluesky_history(tmp_path: Path):
     """Test the Bluesky history functionality."""
     print("Testing Bluesky history functionality...")
     
-    # Create a temporary cache directory for testing
-    test_cache_dir = Path("/tmp/test_webDiis")
-    test_cache_dir.mkdir(exist_ok=True)
+    # Use the temporary directory as cache directory for testing
+    test_cache_dir = tmp_path
     
-    # Create test blsky files
-    test_file = test_cache_dir / "2025-01-01-test_blsky.txt"
+    # Create test blsky files, the second with a name that matches the URL pattern
     sample_content = "This is a test post for Bluesky about a research paper."
-    with open(test_file, 'w') as f:
-        f.write(sample_content)
-    
-    # Create another file with a name that matches the URL pattern
-    url_test_file = test_cache_dir / "2025-01-01-test-paper_blsky.txt"
-    with open(url_test_file, 'w') as f:
-        f.write("This is content from test paper.")
+    files = {
+        "2025-01-01-test_blsky.txt": sample_content.encode('utf-8'),
+        "2025-01-01-test-paper_blsky.txt": b"This is content from test paper.",
+    }
+    for name, data in files.items():
+        (test_cache_dir / name).write_bytes(data)
     
     # Initialize the history manager
     history_manager = BlueskyHistoryManager(test_cache_dir)
@@ -48,12 +46,8 @@ def test_bluesky_history():
     found_similar = history_manager.find_post_by_content(similar_content, "https://diis.unizar.es/test-paper", threshold=0.8)
     print(f"Found similar post: {found_similar}")
     
-    # Clean up
-    import shutil
-    if test_cache_dir.exists():
-        shutil.rmtree(test_cache_dir)
-    
     print("Test completed!")
 
 if __name__ == "__main__":
-    test_bluesky_history()
\ No newline at end of file
+    with tempfile.TemporaryDirectory() as temp_dir:
+        test_bluesky_history(Path(temp_dir))
@@ -1,134 +1,175 @@
+import builtins
+import io
 import pytest
 from click.testing import CliRunner
-from news_manager.cli import cli
-from unittest.mock import patch, mock_open
+from news_manager.cli import cli, generate
+from news_manager.exceptions import ContentProcessingError
+from unittest.mock import MagicMock, patch
+from contextlib import ExitStack
 import os
 from pathlib import Path
-from datetime import date, timedelta
+from types import MappingProxyType
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def runner():
+    # invoke() isolates the streams of each call, so one runner can be shared
     return CliRunner()
 
+# Environment variables read by the CLI
+_CLI_ENV_VARS = (
+    'NEWS_INPUT_FILE',
+    'NEWS_OUTPUT_DIR',
+    'BLUESKY_USER',
+    'NEWS_MANAGER_NON_INTERACTIVE',
+    'NEWS_TEST_SLUG',
+    'GOOGLE_API_KEY',
+)
+
 @pytest.fixture(autouse=True)
 def mock_env_vars():
-    with patch.dict(os.environ, {}, clear=True):
+    # Run every test without the variables the CLI reads
+    saved = {name: os.environ.pop(name) for name in _CLI_ENV_VARS if name in os.environ}
+    try:
         yield
+    finally:
+        os.environ.update(saved)
+
+# Fake file system: every path under /tmp/ is an existing file. Its
+# contents come from here, or are the default for other paths.
+_FAKE_FILE_CONTENTS = {
+    '/tmp/noticia.txt': "Test content from file.",
+    '/tmp/my_custom_input.txt': "Custom test content from file.",
+    '/tmp/env_input.txt': "Test content from ENV.",
+}
+_FAKE_FILE_DEFAULT_CONTENT = "Test content."
+
+
+def _is_fake_path(path):
+    """Return whether a path belongs to the fake file system."""
+    if isinstance(path, os.PathLike):
+        path = os.fspath(path)
+    return isinstance(path, str) and path[:5] == '/tmp/'
 
-@pytest.fixture(autouse=True)
-def mock_os_path_checks():
-    """Fixture to mock file system checks for tests."""
-    original_exists = os.path.exists
-    original_is_file = os.path.isfile
-    original_access = os.access
-
-    def mock_exists(path):
-        if isinstance(path, str) and path.startswith('/tmp/'):
-            return True
-        return original_exists(path)
-
-    def mock_is_file(path):
-        if isinstance(path, str) and path == '/tmp/not_a_file':
-            return False
-        if isinstance(path, str) and path.startswith('/tmp/'):
-            return True
-        return original_is_file(path)
-
-    def mock_access(path, mode):
-        if isinstance(path, str) and path == '/tmp/no_permission.txt' and mode == os.R_OK:
-            return False
-        if isinstance(path, str) and path.startswith('/tmp/'):
-            return True
-        return original_access(path, mode)
-
-    def mock_path_exists(self):
-        return mock_exists(str(self))
-
-    def mock_path_is_file(self):
-        return mock_is_file(str(self))
-
-    with patch('os.path.exists', side_effect=mock_exists), \
-         patch('os.path.isfile', side_effect=mock_is_file), \
-         patch('os.access', side_effect=mock_access), \
-         patch('pathlib.Path.exists', new=mock_path_exists), \
-         patch('pathlib.Path.is_file', new=mock_path_is_file):
-        yield
+
+# Real implementations, captured at import before anything is replaced
+_real_open = builtins.open
+_real_path_exists = Path.exists
+
+
+def _fake_open(file, mode='r', *args, **kwargs):
+    if 'r' not in mode or not _is_fake_path(file):
+        return _real_open(file, mode, *args, **kwargs)
+    return io.StringIO(_FAKE_FILE_CONTENTS.get(os.fspath(file), _FAKE_FILE_DEFAULT_CONTENT))
+
+
+def _fake_path_exists(self, *args, **kwargs):
+    return _is_fake_path(self) or _real_path_exists(self, *args, **kwargs)
 
 
 @pytest.fixture
-def mock_news_generator():
-    with patch('news_manager.cli.NewsGenerator') as mock_generator_class:
-        mock_instance = mock_generator_class.return_value
-        mock_instance.generate_from_file.return_value = {
-            'titulo': 'Test News',
-            'texto': 'This is the text of the test news.',
-            'bluesky': 'Test Bluesky post.',
-            'enlaces': ['- https://example.com/link1'],
-            'raw_output': 'Generated content'
-        }
-        mock_instance.generate_from_url.return_value = {
-            'titulo': 'Test News',
-            'texto': 'This is the text of the test news.',
-            'bluesky': 'Test Bluesky post.',
-            'enlaces': ['- https://example.com/link1'],
-            'raw_output': 'Generated content'
-        }
-        yield mock_instance
+def mock_fs():
+    """Fake the input file checks and reads done by the generate command."""
+    # Plain functions swapped in directly: no patch() or mock call recording
+    replacements = [
+        (builtins, 'open', _fake_open),
+        (Path, 'exists', _fake_path_exists),
+    ]
+    saved = [(target, name, getattr(target, name)) for target, name, _ in replacements]
+    for target, name, replacement in replacements:
+        setattr(target, name, replacement)
+    try:
+        yield
+    finally:
+        for target, name, original in saved:
+            setattr(target, name, original)
+
+
+# Generated content returned by the mocked NewsGenerator, built once at import.
+# Read-only so every test can share the same object.
+_SAMPLE_NEWS = MappingProxyType({
+    'titulo': 'Test News',
+    'texto': 'This is the text of the test news.',
+    'bluesky': 'Test Bluesky post.',
+    'enlaces': ('- https://example.com/link1',),
+    'raw_output': 'Generated content'
+})
+
+
+# Paths reported by the mocked FileManager
+_DEFAULT_NEWS_PATH = Path('/tmp/output/2025-07-16-noticia-de-prueba.txt')
+_THESIS_NEWS_PATH = Path('/tmp/output_thesis/2025-07-16-juan-perez-an-interesting-title.txt')
+_BLUESKY_POST_PATH = Path('/tmp/output_bluesky/2025-07-16-content-of-the-blsky.txt')
+
+
+class _StubNewsGenerator:
+    """Plain stand-in for NewsGenerator; only the generate methods are mocks."""
+
+    def __init__(self):
+        self.generate_from_file = MagicMock()
+        self.generate_from_url = MagicMock()
+        self.generate_from_text = MagicMock()
+
+    def reset(self, content):
+        """Forget recorded calls and side effects and return content again."""
+        for method in (self.generate_from_file, self.generate_from_url, self.generate_from_text):
+            method.reset_mock(return_value=True, side_effect=True)
+            method.return_value = content
+
+
+@pytest.fixture(scope="module")
+def _news_generator_stub():
+    # Patched once for the module; mock_news_generator resets it per test
+    stub = _StubNewsGenerator()
+    with patch('news_manager.cli.NewsGenerator', return_value=stub):
+        yield stub
 
 @pytest.fixture
-def mock_extract_main_text_from_url():
-    with patch('news_manager.web_extractor.WebContentExtractor.extract_content') as mock_extract:
-        mock_extract.return_value = "Contenido de la URL de prueba. " * 10 # Ensure it's long enough
-        yield mock_extract
+def mock_news_generator(_news_generator_stub):
+    _news_generator_stub.reset(_SAMPLE_NEWS)
+    return _news_generator_stub
 
 @pytest.fixture(autouse=False)
 def mock_file_manager():
     with patch('news_manager.cli.FileManager') as mock_fm_class:
         mock_instance = mock_fm_class.return_value
         mock_instance.save_news_content.return_value = {
-            'news': Path('/tmp/output/2025-07-16-noticia-de-prueba.txt')
+            'news': _DEFAULT_NEWS_PATH
         }
         yield mock_instance
 
-@pytest.fixture(autouse=True)
+@pytest.fixture
+def cli_env():
+    """Skip the interactive source selection and read /tmp/dummy_input.txt.
+
+    Yields the ExitStack holding the patches so tests can enter their own.
+    """
+    with ExitStack() as stack:
+        stack.enter_context(patch('news_manager.cli.select_news_source', return_value=None))
+        stack.enter_context(patch('news_manager.cli._select_source_from_menu', return_value=None))
+        stack.enter_context(patch('news_manager.cli._determine_input_file', return_value=Path('/tmp/dummy_input.txt')))
+        yield stack
+
+@pytest.fixture(scope="module", autouse=True)
 def mock_setup_logging():
     with patch('news_manager.cli.setup_logging') as mock_logging:
         yield mock_logging
 
 class TestGenerateCommand:
 
-    def test_generate_with_default_input_file(self, runner, mock_news_generator):
-        # Mock Path.exists and Path.is_file for /tmp/noticia.txt
-        with patch('pathlib.Path.exists', return_value=True), \
-             patch('pathlib.Path.is_file', return_value=True), \
-             patch('builtins.open', mock_open(read_data="Test content from file.")), \
-             patch('news_manager.cli._determine_input_file', return_value=Path('/tmp/noticia.txt')), \
-             patch('news_manager.cli.select_news_source', return_value=None), \
-             patch('news_manager.cli._select_source_from_menu', return_value=None), \
-             patch('os.getenv', side_effect=lambda key: None): # Mock all os.getenv calls to return None
-            
-            result = runner.invoke(cli, ['generate', '--input-file', '/tmp/noticia.txt'])
-            
-            assert result.exit_code == 0
-            assert "--- Reading file: /tmp/noticia.txt ---" in result.output
-            assert "Title: Test News" in result.output
-            assert "Text: This is the text of the test news." in result.output
-            mock_news_generator.generate_from_file.assert_called_once()
-
-
-
-    def test_generate_with_input_file_option(self, runner, mock_news_generator):
-        test_file_path = "/tmp/my_custom_input.txt"
-        with patch('pathlib.Path.exists', return_value=True), \
-             patch('pathlib.Path.is_file', return_value=True), \
-             patch('builtins.open', mock_open(read_data="Custom test content from file.")):
-            
-            result = runner.invoke(cli, ['generate', '-i', test_file_path])
-            
-            assert result.exit_code == 0
-            assert f"--- Reading file: {test_file_path} ---" in result.output
-            assert "Title: Test News" in result.output
-            mock_news_generator.generate_from_file.assert_called_once()
+    @pytest.mark.parametrize("argv,expected_path", [
+        (['--input-file', '/tmp/noticia.txt'], '/tmp/noticia.txt'),
+        (['-i', '/tmp/my_custom_input.txt'], '/tmp/my_custom_input.txt'),
+    ], ids=['default_input_file', 'input_file_option'])
+    def test_generate_input_file(self, runner, mock_fs, mock_news_generator, argv, expected_path):
+        # The input files exist in the fake file system (mock_fs)
+        result = runner.invoke(cli, ['generate'] + argv)
+        
+        assert result.exit_code == 0
+        output_lines = set(result.output.splitlines())
+        assert f"--- Reading file: {expected_path} ---" in output_lines
+        assert "Title: Test News" in output_lines
+        assert "Text: This is the text of the test news." in output_lines
+        mock_news_generator.generate_from_file.assert_called_once_with(Path(expected_path), None)
 
 
 
@@ -137,111 +178,77 @@ class TestGenerateCommand:
         result = runner.invoke(cli, ['generate', '--url', test_url])
         
         assert result.exit_code == 0
-        assert f"--- Downloading and extracting news from: {test_url} ---" in result.output
-        assert "Title: Test News" in result.output
+        output_lines = set(result.output.splitlines())
+        assert f"--- Downloading and extracting news from: {test_url} ---" in output_lines
+        assert "Title: Test News" in output_lines
         mock_news_generator.generate_from_url.assert_called_once()
 
 
 
-    def test_generate_exclusive_options_error(self, runner):
-        result = runner.invoke(cli, ['generate', '-i', '/tmp/file.txt', '--url', 'http://example.com'])
-        assert result.exit_code != 0
-        assert "Error: You cannot use --input-file and --url at the same time." in result.output
+    def test_generate_exclusive_options_error(self, capsys):
+        # Pure option validation: call the command callback without CliRunner
+        with pytest.raises(SystemExit) as excinfo:
+            generate.callback(input_file=Path('/tmp/file.txt'), url='http://example.com',
+                              prompt_extra=None, interactive_prompt=False, output_dir=None, user=None)
+        assert excinfo.value.code != 0
+        assert "Error: You cannot use --input-file and --url at the same time." in capsys.readouterr().err
 
 
 
-    def test_generate_with_prompt_extra(self, runner, mock_news_generator):
+    def test_generate_with_prompt_extra(self, runner, cli_env, mock_fs, mock_news_generator):
         test_prompt = "Focus on the technical details."
-        with patch('pathlib.Path.exists', return_value=True), \
-             patch('pathlib.Path.is_file', return_value=True), \
-             patch('builtins.open', mock_open(read_data="Test content.")), \
-             patch('news_manager.cli.select_news_source', return_value=None), \
-             patch('news_manager.cli._select_source_from_menu', return_value=None), \
-             patch('os.getenv', side_effect=lambda key: None), \
-             patch('news_manager.cli._determine_input_file', return_value=Path('/tmp/dummy_input.txt')):
-            
-            result = runner.invoke(cli, ['generate', '--input-file', '/tmp/dummy_input.txt', '--prompt-extra', test_prompt])
-            
-            result = runner.invoke(cli, ['generate', '--prompt-extra', test_prompt])
-            
-            assert result.exit_code == 0
-            assert f"--- Additional instructions: {test_prompt} ---" in result.output
-            # Check that generate_from_file was called with the prompt
-            args, kwargs = mock_news_generator.generate_from_file.call_args
-            assert test_prompt in args
-
-
-
-    def test_generate_with_interactive_prompt(self, runner, mock_news_generator):
+        result = runner.invoke(cli, ['generate', '--input-file', '/tmp/dummy_input.txt', '--prompt-extra', test_prompt])
+
+        assert result.exit_code == 0
+        assert f"--- Additional instructions: {test_prompt} ---" in result.output
+        # Check that generate_from_file was called with the prompt
+        args, kwargs = mock_news_generator.generate_from_file.call_args
+        assert test_prompt in args
+
+
+
+    def test_generate_with_interactive_prompt(self, runner, cli_env, mock_fs, mock_news_generator):
         test_prompt = "Interactive instruction."
-        with patch('pathlib.Path.exists', return_value=True), \
-             patch('pathlib.Path.is_file', return_value=True), \
-             patch('builtins.open', mock_open(read_data="Test content.")), \
-             patch('news_manager.cli.select_news_source', return_value=None), \
-             patch('news_manager.cli._select_source_from_menu', return_value=None), \
-             patch('os.getenv', side_effect=lambda key: None), \
-             patch('news_manager.cli._determine_input_file', return_value=Path('/tmp/dummy_input.txt')):
-            
-            result = runner.invoke(cli, ['generate', '--interactive-prompt', '--input-file', '/tmp/dummy_input.txt'], input=test_prompt + '\n')
-            
-            assert result.exit_code == 0
-            assert "--- Additional instructions ---" in result.output
-            assert f"--- Additional instructions: {test_prompt} ---" in result.output
-            # Check that generate_from_file was called with the prompt
-            args, kwargs = mock_news_generator.generate_from_file.call_args
-            assert test_prompt in args
-
-
-
-    def test_generate_with_output_dir(self, runner, mock_news_generator, mock_file_manager):
+        result = runner.invoke(cli, ['generate', '--interactive-prompt', '--input-file', '/tmp/dummy_input.txt'], input=test_prompt + '\n')
+
+        assert result.exit_code == 0
+        output_lines = set(result.output.splitlines())
+        assert "--- Additional instructions ---" in output_lines
+        assert f"--- Additional instructions: {test_prompt} ---" in output_lines
+        # Check that generate_from_file was called with the prompt
+        args, kwargs = mock_news_generator.generate_from_file.call_args
+        assert test_prompt in args
+
+
+
+    def test_generate_with_output_dir(self, runner, cli_env, mock_fs, mock_news_generator, mock_file_manager):
         test_output_dir = "/tmp/output_news"
-        with patch('pathlib.Path.exists', return_value=True), \
-             patch('pathlib.Path.is_file', return_value=True), \
-             patch('builtins.open', mock_open(read_data="Test content.")), \
-             patch('news_manager.cli.select_news_source', return_value=None), \
-             patch('news_manager.cli._select_source_from_menu', return_value=None), \
-             patch('os.getenv', side_effect=lambda key: None), \
-             patch('news_manager.cli._determine_input_file', return_value=Path('/tmp/dummy_input.txt')):
-            
-            result = runner.invoke(cli, ['generate', '--output-dir', test_output_dir, '--input-file', '/tmp/dummy_input.txt'])
-            
-            assert result.exit_code == 0
-            assert "News saved in:" in result.output
-            mock_file_manager.save_news_content.assert_called_once()
-
-
-
-    def test_generate_with_news_input_file_env_var(self, runner, mock_news_generator, mock_env_vars):
-        os.environ['NEWS_INPUT_FILE'] = "/tmp/env_input.txt"
-        with patch('pathlib.Path.exists', return_value=True), \
-             patch('pathlib.Path.is_file', return_value=True), \
-             patch('builtins.open', mock_open(read_data="Test content from ENV.")), \
-             patch('news_manager.cli.select_news_source', return_value=None), \
-             patch('news_manager.cli._select_source_from_menu', return_value=None), \
-             patch('news_manager.cli._determine_input_file', return_value=Path("/tmp/env_input.txt")):
-            
-            result = runner.invoke(cli, ['generate', '--input-file', '/tmp/dummy_input.txt'])
-            
-            assert result.exit_code == 0
-            assert "--- Reading file: /tmp/env_input.txt ---" in result.output
-            mock_news_generator.generate_from_file.assert_called_once()
-
-
-
-    def test_generate_with_news_output_dir_env_var(self, runner, mock_news_generator, mock_file_manager, mock_env_vars):
-        os.environ['NEWS_OUTPUT_DIR'] = "/tmp/env_output_news"
-        with patch('pathlib.Path.exists', return_value=True), \
-             patch('pathlib.Path.is_file', return_value=True), \
-             patch('builtins.open', mock_open(read_data="Test content.")), \
-             patch('news_manager.cli.select_news_source', return_value=None), \
-             patch('news_manager.cli._select_source_from_menu', return_value=None), \
-             patch('news_manager.cli._determine_input_file', return_value=Path('/tmp/dummy_input.txt')):
-            
-            result = runner.invoke(cli, ['generate', '--input-file', '/tmp/dummy_input.txt'])
-            
-            assert result.exit_code == 0
-            assert "News saved in:" in result.output
-            mock_file_manager.save_news_content.assert_called_once()
+        result = runner.invoke(cli, ['generate', '--output-dir', test_output_dir, '--input-file', '/tmp/dummy_input.txt'])
+
+        assert result.exit_code == 0
+        assert "News saved in:" in result.output
+        mock_file_manager.save_news_content.assert_called_once()
+
+
+
+    def test_generate_with_news_input_file_env_var(self, runner, cli_env, mock_fs, mock_news_generator, monkeypatch):
+        monkeypatch.setenv("NEWS_INPUT_FILE", "/tmp/env_input.txt")
+        cli_env.enter_context(patch('news_manager.cli._determine_input_file', return_value=Path("/tmp/env_input.txt")))
+        result = runner.invoke(cli, ['generate', '--input-file', '/tmp/dummy_input.txt'])
+
+        assert result.exit_code == 0
+        assert "--- Reading file: /tmp/env_input.txt ---" in result.output
+        mock_news_generator.generate_from_file.assert_called_once()
+
+
+
+    def test_generate_with_news_output_dir_env_var(self, runner, cli_env, mock_fs, mock_news_generator, mock_file_manager, monkeypatch):
+        monkeypatch.setenv("NEWS_OUTPUT_DIR", "/tmp/env_output_news")
+        result = runner.invoke(cli, ['generate', '--input-file', '/tmp/dummy_input.txt'])
+
+        assert result.exit_code == 0
+        assert "News saved in:" in result.output
+        mock_file_manager.save_news_content.assert_called_once()
 
 
 
@@ -281,95 +288,36 @@ class TestGenerateCommand:
 
 
 
-    def test_generate_file_not_found_error(self, runner, mock_news_generator):
-        from news_manager.exceptions import ContentProcessingError
-        with patch('news_manager.cli._determine_input_file', return_value=Path('/nonexistent/file.txt')), \
-             patch('news_manager.cli.select_news_source', return_value=None), \
-             patch('news_manager.cli._select_source_from_menu', return_value=None):
-            mock_news_generator.generate_from_file.side_effect = ContentProcessingError("File does not exist")
-            result = runner.invoke(cli, ['generate', '-i', '/nonexistent/file.txt'])
-            assert result.exit_code != 0
-            assert "Error: File does not exist" in result.output
-
-
-
-    def test_generate_path_is_not_file_error(self, runner, mock_news_generator):
-        from news_manager.exceptions import ContentProcessingError
-        mock_news_generator.generate_from_file.side_effect = ContentProcessingError("Path is not a file")
-        result = runner.invoke(cli, ['generate', '-i', '/tmp/not_a_file'])
-        assert result.exit_code != 0
-        assert "Error:" in result.output
-
-
-
-    def test_generate_empty_input_file_error(self, runner, mock_news_generator):
-        from news_manager.exceptions import ContentProcessingError
-        mock_news_generator.generate_from_file.side_effect = ContentProcessingError("File is empty")
-        result = runner.invoke(cli, ['generate', '-i', '/tmp/empty.txt'])
+    @pytest.mark.parametrize("method,error,cli_args,expected", [
+        ('generate_from_file', ContentProcessingError("File does not exist"),
+         ['-i', '/nonexistent/file.txt'], "Error: File does not exist"),
+        ('generate_from_file', ContentProcessingError("Path is not a file"),
+         ['-i', '/tmp/not_a_file'], "Error:"),
+        ('generate_from_file', ContentProcessingError("File is empty"),
+         ['-i', '/tmp/empty.txt'], "Error:"),
+        ('generate_from_url', ContentProcessingError("Failed to extract content from URL"),
+         ['--url', 'http://bad.url'], "Error:"),
+        ('generate_from_url', ContentProcessingError("Insufficient content extracted"),
+         ['--url', 'http://empty.url'], "Error:"),
+        ('generate_from_file', ContentProcessingError("Cannot read file. Please verify it's a valid text file."),
+         ['-i', '/tmp/bad_encoding.txt'], "Error:"),
+        ('generate_from_file', ContentProcessingError("No permission to read file"),
+         ['-i', '/tmp/no_permission.txt'], "Error:"),
+        ('generate_from_file', Exception("Unexpected error"),
+         ['-i', '/tmp/any_file.txt'], "Unexpected error:"),
+    ], ids=['file_not_found', 'path_is_not_file', 'empty_input_file', 'url_extraction',
+            'url_empty_content', 'unicode_decode', 'permission', 'general_exception'])
+    def test_generate_errors(self, runner, mock_news_generator, method, error, cli_args, expected):
+        getattr(mock_news_generator, method).side_effect = error
+        # Skip the input file existence check so the generator error is reached
+        with patch('news_manager.cli._determine_input_file', side_effect=lambda input_file, url: input_file):
+            result = runner.invoke(cli, ['generate'] + cli_args)
         assert result.exit_code != 0
-        assert "Error:" in result.output
-
-
-
-    def test_generate_url_extraction_error(self, runner, mock_news_generator):
-        from news_manager.exceptions import ContentProcessingError
-        mock_news_generator.generate_from_url.side_effect = ContentProcessingError("Failed to extract content from URL")
-        result = runner.invoke(cli, ['generate', '--url', 'http://bad.url'])
-        assert result.exit_code != 0
-        assert "Error:" in result.output
-
-
-
-    def test_generate_url_empty_content_error(self, runner, mock_news_generator):
-        from news_manager.exceptions import ContentProcessingError
-        mock_news_generator.generate_from_url.side_effect = ContentProcessingError("Insufficient content extracted")
-        result = runner.invoke(cli, ['generate', '--url', 'http://empty.url'])
-        assert result.exit_code != 0
-        assert "Error:" in result.output
-
-
-
-    def test_generate_unicode_decode_error(self, runner, mock_news_generator):
+        assert expected in result.output
 
-        from news_manager.exceptions import ContentProcessingError
 
-        mock_news_generator.generate_from_file.side_effect = ContentProcessingError("Cannot read file. Please verify it's a valid text file.")
 
-        result = runner.invoke(cli, ['generate', '-i', '/tmp/bad_encoding.txt'])
-
-        assert result.exit_code != 0
-
-        assert "Error:" in result.output
-
-
-
-    def test_generate_permission_error(self, runner, mock_news_generator):
-
-        from news_manager.exceptions import ContentProcessingError
-
-        mock_news_generator.generate_from_file.side_effect = ContentProcessingError("No permission to read file")
-
-        result = runner.invoke(cli, ['generate', '-i', '/tmp/no_permission.txt'])
-
-        assert result.exit_code != 0
-
-        assert "Error:" in result.output
-
-
-
-    def test_generate_general_exception(self, runner, mock_news_generator):
-
-        mock_news_generator.generate_from_file.side_effect = Exception("Unexpected error")
-
-        result = runner.invoke(cli, ['generate', '-i', '/tmp/any_file.txt'])
-
-        assert result.exit_code != 0
-
-        assert "Unexpected error:" in result.output
-
-
-
-    def test_generate_thesis_slug_generation(self, runner, mock_news_generator, mock_file_manager):
+    def test_generate_thesis_slug_generation(self, runner, cli_env, mock_fs, mock_news_generator, mock_file_manager):
 
         test_output_dir = "/tmp/output_thesis"
 
@@ -389,24 +337,16 @@ class TestGenerateCommand:
 
         mock_file_manager.save_news_content.return_value = {
 
-            'news': Path(f"{test_output_dir}/2025-07-16-juan-perez-an-interesting-title.txt")
+            'news': _THESIS_NEWS_PATH
 
         }
-        with patch('pathlib.Path.exists', return_value=True), \
-             patch('pathlib.Path.is_file', return_value=True), \
-             patch('builtins.open', mock_open(read_data="Test content.")), \
-             patch('news_manager.cli.select_news_source', return_value=None), \
-             patch('news_manager.cli._select_source_from_menu', return_value=None), \
-             patch('os.getenv', side_effect=lambda key: None), \
-             patch('news_manager.cli._determine_input_file', return_value=Path('/tmp/dummy_input.txt')):
-            
-            result = runner.invoke(cli, ['generate', '--output-dir', test_output_dir, '--input-file', '/tmp/dummy_input.txt'])
+        result = runner.invoke(cli, ['generate', '--output-dir', test_output_dir, '--input-file', '/tmp/dummy_input.txt'])
 
-            assert result.exit_code == 0
+        assert result.exit_code == 0
 
-            assert "News saved in:" in result.output
+        assert "News saved in:" in result.output
 
-            mock_file_manager.save_news_content.assert_called_once()
+        mock_file_manager.save_news_content.assert_called_once()
 
 
 
@@ -436,7 +376,7 @@ class TestGenerateCommand:
 
         mock_file_manager.save_news_content.return_value = {
 
-            'bluesky': Path(f"{test_output_dir}/2025-07-16-content-of-the-blsky.txt")
+            'bluesky': _BLUESKY_POST_PATH
 
         }
 
@@ -5,6 +5,26 @@ from news_manager.llm import GeminiClient, LLMClient, SYSTEM_PROMPT
 from news_manager.exceptions import ConfigurationError, APIError
 
 
+@pytest.fixture(scope="module", autouse=True)
+def _patched_genai():
+    # Patched once for the module; mock_genai resets it per test
+    with patch('news_manager.llm.genai') as mock_genai:
+        yield mock_genai
+
+
+@pytest.fixture
+def mock_genai(_patched_genai):
+    _patched_genai.reset_mock(return_value=True, side_effect=True)
+    return _patched_genai
+
+
+@pytest.fixture
+def mock_model(mock_genai):
+    model = Mock()
+    mock_genai.GenerativeModel.return_value = model
+    return model
+
+
 class TestLLMClient:
     """Test the base LLMClient class."""
     
@@ -21,13 +41,12 @@ class TestGeminiClient:
     """Test the GeminiClient class."""
     
     @patch.dict(os.environ, {'GOOGLE_API_KEY': 'test_key'})
-    def test_gemini_client_initialization(self):
+    def test_gemini_client_initialization(self, mock_genai):
         """Test GeminiClient initialization with valid API key."""
-        with patch('news_manager.llm.genai') as mock_genai:
-            client = GeminiClient()
-            assert client.model is not None
-            mock_genai.configure.assert_called_once_with(api_key='test_key')
-    
+        client = GeminiClient()
+        assert client.model is not None
+        mock_genai.configure.assert_called_once_with(api_key='test_key')
+
     def test_gemini_client_no_api_key(self):
         """Test GeminiClient initialization without API key."""
         with patch.dict(os.environ, {}, clear=True):
@@ -35,7 +54,7 @@ class TestGeminiClient:
                 GeminiClient()
     
     @patch.dict(os.environ, {'GOOGLE_API_KEY': 'test_key'})
-    def test_generate_news_basic(self):
+    def test_generate_news_basic(self, mock_model):
         """Test basic news generation."""
         mock_response = Mock()
         mock_response.text = """Título: Test Title
@@ -44,121 +63,99 @@ Enlaces:
 - https://example.com
 Bluesky: Test bluesky post."""
         
-        with patch('news_manager.llm.genai') as mock_genai:
-            mock_model = Mock()
-            mock_model.generate_content.return_value = mock_response
-            mock_genai.GenerativeModel.return_value = mock_model
-            
-            client = GeminiClient()
-            result = client.generate_news("Test input text")
-            
-            assert "Título: Test Title" in result
-            assert "Texto: Test content" in result
-            assert "Bluesky: Test bluesky post" in result
-    
+        mock_model.generate_content.return_value = mock_response
+
+        client = GeminiClient()
+        result = client.generate_news("Test input text")
+
+        assert "Título: Test Title" in result
+        assert "Texto: Test content" in result
+        assert "Bluesky: Test bluesky post" in result
+
     @patch.dict(os.environ, {'GOOGLE_API_KEY': 'test_key'})
-    def test_generate_news_with_prompt_extra(self):
+    def test_generate_news_with_prompt_extra(self, mock_model):
         """Test news generation with extra prompt."""
         mock_response = Mock()
         mock_response.text = "Generated content"
         
-        with patch('news_manager.llm.genai') as mock_genai:
-            mock_model = Mock()
-            mock_model.generate_content.return_value = mock_response
-            mock_genai.GenerativeModel.return_value = mock_model
-            
-            client = GeminiClient()
-            result = client.generate_news("Test input", "Focus on technology")
-            
-            # Verify that the prompt_extra was included in the call
-            call_args = mock_model.generate_content.call_args[0][0]
-            assert "Focus on technology" in call_args
-    
+        mock_model.generate_content.return_value = mock_response
+
+        client = GeminiClient()
+        result = client.generate_news("Test input", "Focus on technology")
+
+        # Verify that the prompt_extra was included in the call
+        call_args = mock_model.generate_content.call_args[0][0]
+        assert "Focus on technology" in call_args
+
     @patch.dict(os.environ, {'GOOGLE_API_KEY': 'test_key'})
-    def test_generate_news_with_url(self):
+    def test_generate_news_with_url(self, mock_model):
         """Test news generation with URL."""
         mock_response = Mock()
         mock_response.text = "Generated content"
         
-        with patch('news_manager.llm.genai') as mock_genai:
-            mock_model = Mock()
-            mock_model.generate_content.return_value = mock_response
-            mock_genai.GenerativeModel.return_value = mock_model
-            
-            client = GeminiClient()
-            result = client.generate_news("Test input", url="https://example.com")
-            
-            # Verify that the URL was included in the call
-            call_args = mock_model.generate_content.call_args[0][0]
-            assert "https://example.com" in call_args
-    
+        mock_model.generate_content.return_value = mock_response
+
+        client = GeminiClient()
+        result = client.generate_news("Test input", url="https://example.com")
+
+        # Verify that the URL was included in the call
+        call_args = mock_model.generate_content.call_args[0][0]
+        assert "https://example.com" in call_args
+
     @patch.dict(os.environ, {'GOOGLE_API_KEY': 'test_key'})
-    def test_generate_news_api_error(self):
+    def test_generate_news_api_error(self, mock_model):
         """Test handling of API errors."""
-        with patch('news_manager.llm.genai') as mock_genai:
-            mock_model = Mock()
-            mock_model.generate_content.side_effect = Exception("API Error")
-            mock_genai.GenerativeModel.return_value = mock_model
-            
-            client = GeminiClient()
-            
-            with pytest.raises(APIError, match="Failed to generate content"):
-                client.generate_news("Test input")
-    
+        mock_model.generate_content.side_effect = Exception("API Error")
+
+        client = GeminiClient()
+
+        with pytest.raises(APIError, match="Failed to generate content"):
+            client.generate_news("Test input")
+
     @patch.dict(os.environ, {'GOOGLE_API_KEY': 'test_key'})
-    def test_generate_news_all_parameters(self):
+    def test_generate_news_all_parameters(self, mock_model):
         """Test news generation with all parameters."""
         mock_response = Mock()
         mock_response.text = "Generated content"
         
-        with patch('news_manager.llm.genai') as mock_genai:
-            mock_model = Mock()
-            mock_model.generate_content.return_value = mock_response
-            mock_genai.GenerativeModel.return_value = mock_model
-            
-            client = GeminiClient()
-            result = client.generate_news(
-                "Test input", 
-                "Focus on science", 
-                "https://example.com"
-            )
-            
-            # Verify all parameters were included
-            call_args = mock_model.generate_content.call_args[0][0]
-            assert "Focus on science" in call_args
-            assert "https://example.com" in call_args
-            assert "Test input" in call_args
+        mock_model.generate_content.return_value = mock_response
+
+        client = GeminiClient()
+        result = client.generate_news(
+            "Test input", 
+            "Focus on science", 
+            "https://example.com"
+        )
+
+        # Verify all parameters were included
+        call_args = mock_model.generate_content.call_args[0][0]
+        assert "Focus on science" in call_args
+        assert "https://example.com" in call_args
+        assert "Test input" in call_args
 
 
 class TestSystemPrompt:
     """Test the system prompt content."""
     
-    def test_system_prompt_contains_required_sections(self):
-        """Test that the system prompt contains all required sections."""
-        assert "Title:" in SYSTEM_PROMPT
-        assert "Text:" in SYSTEM_PROMPT
-        assert "Links:" in SYSTEM_PROMPT
-        assert "Bluesky:" in SYSTEM_PROMPT
-    
-    def test_system_prompt_format_example(self):
-        """Test that the system prompt contains the correct format example."""
-        assert "Title: [Generated title]" in SYSTEM_PROMPT
-        assert "Text: [Generated text]" in SYSTEM_PROMPT
-        assert "https://example.com/news" in SYSTEM_PROMPT
-        assert "Bluesky: [Generated post]" in SYSTEM_PROMPT
-    
-    def test_system_prompt_style_guidelines(self):
-        """Test that the system prompt contains style guidelines."""
-        assert "Active Voice" in SYSTEM_PROMPT
-        assert "Neutral Tone" in SYSTEM_PROMPT
-        assert "informative and objective" in SYSTEM_PROMPT
+    @pytest.mark.parametrize("needle", [
+        # Required sections
+        "Title:", "Text:", "Links:", "Bluesky:",
+        # Format example
+        "Title: [Generated title]", "Text: [Generated text]",
+        "https://example.com/news", "Bluesky: [Generated post]",
+        # Style guidelines
+        "Active Voice", "Neutral Tone", "informative and objective",
+    ])
+    def test_system_prompt_contains(self, needle):
+        """Test that the system prompt contains each required fragment."""
+        assert needle in SYSTEM_PROMPT
 
 
 class TestIntegration:
     """Integration tests for the LLM module."""
     
     @patch.dict(os.environ, {'GOOGLE_API_KEY': 'test_key'})
-    def test_full_generation_flow(self):
+    def test_full_generation_flow(self, mock_model):
         """Test the complete generation flow."""
         expected_output = """Title: Test News
 Text: This is a test news article.
@@ -169,16 +166,13 @@ Bluesky: Test bluesky post."""
         mock_response = Mock()
         mock_response.text = expected_output
         
-        with patch('news_manager.llm.genai') as mock_genai:
-            mock_model = Mock()
-            mock_model.generate_content.return_value = mock_response
-            mock_genai.GenerativeModel.return_value = mock_model
-            
-            client = GeminiClient()
-            result = client.generate_news("Test input text")
-            
-            assert result == expected_output
-            mock_model.generate_content.assert_called_once()
+        mock_model.generate_content.return_value = mock_response
+
+        client = GeminiClient()
+        result = client.generate_news("Test input text")
+
+        assert result == expected_output
+        mock_model.generate_content.assert_called_once()
 
 
 if __name__ == '__main__':
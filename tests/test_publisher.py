@@ -0,0 +1,109 @@
+import os
+import pytest
+from unittest.mock import MagicMock, patch
+
+from news_publisher.cli import publish_bluesky, publish_content, _bluesky_config
+
+
+class TestPublishBluesky:
+    """Test the publish_bluesky function."""
+
+    def test_publishes_most_recent_file(self, tmp_path):
+        """Test that the most recently modified post is published."""
+        old_file = tmp_path / "2025-01-01-old_blsky.txt"
+        new_file = tmp_path / "2025-01-02-new_blsky.txt"
+        old_file.write_text("Old post\n", encoding='utf-8')
+        new_file.write_text("New post\n", encoding='utf-8')
+        (tmp_path / "2025-01-03-news.txt").write_text("Not a post", encoding='utf-8')
+        os.utime(old_file, (1000, 1000))
+        os.utime(new_file, (2000, 2000))
+
+        with patch('news_publisher.cli.publish_content') as mock_publish:
+            publish_bluesky(str(tmp_path), "user.bsky.social")
+
+        mock_publish.assert_called_once_with("New post", "user.bsky.social")
+
+    def test_no_files(self, tmp_path):
+        """Test that an empty directory exits with an error."""
+        with patch('news_publisher.cli.publish_content') as mock_publish:
+            with pytest.raises(SystemExit):
+                publish_bluesky(str(tmp_path), "user.bsky.social")
+        mock_publish.assert_not_called()
+
+    def test_missing_directory(self, tmp_path):
+        """Test that a missing directory exits with an error."""
+        with pytest.raises(SystemExit):
+            publish_bluesky(str(tmp_path / "missing"), "user.bsky.social")
+
+    def test_directory_is_a_file(self, tmp_path, capsys):
+        """Test that a regular file given as the directory exits with an error."""
+        not_a_dir = tmp_path / "post_blsky.txt"
+        not_a_dir.write_text("Post\n", encoding='utf-8')
+        with pytest.raises(SystemExit):
+            publish_bluesky(str(not_a_dir), "user.bsky.social")
+        assert "No se encontró ningún archivo *_blsky.txt" in capsys.readouterr().err
+
+
+class TestPublishContent:
+    """Test the publish/edit/cancel loop of publish_content."""
+
+    @pytest.fixture
+    def mock_api(self):
+        """Provide a fake socialModules API."""
+        api = MagicMock()
+        config_mod = MagicMock()
+        config_mod.getApi.return_value = api
+        with patch.dict('sys.modules', {'socialModules': MagicMock(), 'socialModules.configMod': config_mod}):
+            yield api
+
+    def test_publish(self, mock_api):
+        """Test that the last URL is sent as the link."""
+        with patch('news_publisher.cli.click.prompt', return_value='p'), \
+             patch('news_publisher.cli.edit_content_in_editor') as mock_edit:
+            publish_content("Nueva noticia https://example.com/news", "user.bsky.social")
+        mock_edit.assert_not_called()
+        mock_api.publishPost.assert_called_once_with("Nueva noticia", "https://example.com/news", "")
+
+    def test_cancel_does_not_open_editor(self, mock_api):
+        """Test that cancelling neither edits nor publishes."""
+        with patch('news_publisher.cli.click.prompt', return_value='c'), \
+             patch('news_publisher.cli.edit_content_in_editor') as mock_edit:
+            publish_content("Nueva noticia", "user.bsky.social")
+        mock_edit.assert_not_called()
+        mock_api.publishPost.assert_not_called()
+
+    def test_edit_then_publish(self, mock_api):
+        """Test that the edited content is published."""
+        with patch('news_publisher.cli.click.prompt', side_effect=['e', 'p']), \
+             patch('news_publisher.cli.edit_content_in_editor', return_value="Texto editado") as mock_edit:
+            publish_content("Nueva noticia", "user.bsky.social")
+        mock_edit.assert_called_once_with("Nueva noticia")
+        mock_api.publishPost.assert_called_once_with("Texto editado", "", "")
+
+
+class TestBlueskyConfig:
+    """Test the cached Bluesky configuration loader."""
+
+    def test_config_is_cached(self, tmp_path):
+        """Test that an unchanged file is parsed only once."""
+        config_path = tmp_path / ".rssBlsk"
+        config_path.write_text("[user1]\n[user2]\n", encoding='utf-8')
+        assert _bluesky_config(str(config_path)) is _bluesky_config(str(config_path))
+
+    def test_modified_config_is_reloaded(self, tmp_path):
+        """Test that edits to the file are picked up."""
+        config_path = tmp_path / ".rssBlsk"
+        config_path.write_text("[user1]\n", encoding='utf-8')
+        os.utime(config_path, (1000, 1000))
+        assert _bluesky_config(str(config_path)).sections() == ['user1']
+        config_path.write_text("[user1]\n[user2]\n", encoding='utf-8')
+        os.utime(config_path, (2000, 2000))
+        assert _bluesky_config(str(config_path)).sections() == ['user1', 'user2']
+
+    def test_missing_config(self, tmp_path):
+        """Test that a missing file gives an empty configuration."""
+        assert _bluesky_config(str(tmp_path / "missing")).sections() == []
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
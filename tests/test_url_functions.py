@@ -245,5 +245,146 @@ class TestContentExtraction:
         # This is expected behavior for now
 
 
+class TestSessionReuse:
+    """Test that HTTP connections are shared between extractors."""
+
+    def test_extractors_share_session(self):
+        """Test that extractors use the same pooled session by default."""
+        assert WebContentExtractor().session is WebContentExtractor().session
+
+    def test_default_session_headers(self):
+        """Test that the shared session identifies the application."""
+        assert 'NewsManager' in WebContentExtractor().session.headers['User-Agent']
+
+    def test_custom_session(self):
+        """Test that a custom session can be injected."""
+        session = requests.Session()
+        assert WebContentExtractor(session=session).session is session
+
+    def test_adapter_retries_with_backoff(self):
+        """Test that transient errors are retried by the session adapter."""
+        retry = WebContentExtractor().session.get_adapter('https://example.com').max_retries
+        assert retry.total == 2
+        assert retry.backoff_factor > 0
+        assert 503 in retry.status_forcelist
+        # A server's Retry-After must not stall the CLI
+        assert retry.respect_retry_after_header is False
+
+    def test_custom_retry_count_gets_own_session(self):
+        """Test that a non-default retry count does not alter the shared session."""
+        extractor = WebContentExtractor(retry_count=5)
+        assert extractor.session is not WebContentExtractor().session
+        assert extractor.session.get_adapter('https://example.com').max_retries.total == 4
+
+    @patch('news_manager.web_extractor.requests.Session.get')
+    def test_diis_spanish_url_rewrite(self, mock_get):
+        """Test that a 404 on a diis.unizar.es /es/ URL retries without /es/."""
+        not_found = Mock()
+        not_found.raise_for_status.side_effect = requests.HTTPError(response=Mock(status_code=404))
+        found = Mock()
+        found.text = "<html><body><p>Contenido de la noticia</p></body></html>"
+        found.raise_for_status.return_value = None
+        mock_get.side_effect = [not_found, found]
+
+        result = WebContentExtractor().extract_content("https://diis.unizar.es/es/noticia")
+
+        assert "Contenido de la noticia" in result
+        assert mock_get.call_args[0][0] == "https://diis.unizar.es/noticia"
+
+
+class TestParsers:
+    """Test that both HTML parsers extract the same text."""
+
+    ARTICLE_HTML = """
+    <html>
+    <head><title>Title</title><script>var tracking = 1;</script></head>
+    <body>
+        <nav>Menu</nav>
+        <article><h1>Article Title</h1><p>""" + "Article paragraph. " * 20 + """</p></article>
+    </body>
+    </html>
+    """
+
+    DIV_HTML = """
+    <html>
+    <body>
+        <div class="sidebar">Short sidebar</div>
+        <div class="content"><section><p>""" + "Section paragraph. " * 20 + """</p></section><p>Tail</p></div>
+    </body>
+    </html>
+    """
+
+    SMALL_HTML = "<html><head><title>Small</title><style>p {}</style></head><body><p>Tiny page</p></body></html>"
+
+    # Indented markup: whitespace between tags is not text
+    INDENTED_HTML = """
+    <html>
+      <body>
+        <article>
+          <h1>Headline</h1>
+""" + "".join(f"          <p>Short item {i}.</p>\n" for i in range(20)) + """        </article>
+      </body>
+    </html>
+    """
+
+    # Short indented article, so the largest block strategy is used
+    INDENTED_DIV_HTML = """
+    <html>
+      <body>
+        <div class="content">
+          <article>
+            <h1>Headline</h1>
+""" + "".join(f"            <p>Short item {i}.</p>\n" for i in range(12)) + """          </article>
+          <p>""" + "Div paragraph. " * 20 + """</p>
+        </div>
+      </body>
+    </html>
+    """
+
+    @pytest.mark.parametrize("html", [ARTICLE_HTML, DIV_HTML, SMALL_HTML, INDENTED_HTML, INDENTED_DIV_HTML],
+                             ids=['article', 'div', 'small', 'indented', 'indented_div'])
+    def test_selectolax_matches_beautifulsoup(self, html):
+        """Test that selectolax and BeautifulSoup give the same result."""
+        pytest.importorskip("selectolax")
+        fast = WebContentExtractor(use_selectolax=True)._parse_content(html)
+        slow = WebContentExtractor(use_selectolax=False)._parse_content(html)
+        assert fast == slow
+
+    def test_largest_block_is_outermost_with_most_text(self):
+        """Test that the container holding the most text wins."""
+        selectolax = pytest.importorskip("selectolax.lexbor")
+        tree = selectolax.LexborHTMLParser(self.DIV_HTML)
+        best = WebContentExtractor._largest_text_block(tree)
+        assert best.tag == 'div'
+        assert best.attributes.get('class') == 'content'
+
+    def test_article_page_skips_full_parse(self):
+        """Test that BeautifulSoup parses only <article> when it has enough text."""
+        from news_manager import web_extractor
+        with patch.object(web_extractor, 'BeautifulSoup', wraps=web_extractor.BeautifulSoup) as mock_soup:
+            result = WebContentExtractor(use_selectolax=False)._parse_content(self.ARTICLE_HTML)
+        assert "Article Title" in result
+        mock_soup.assert_called_once()
+        assert 'parse_only' in mock_soup.call_args[1]
+
+    @pytest.mark.parametrize("html,expected", [
+        ("<h1>Not Found</h1>Page &amp; post", "Not Found\nPage & post"),
+        # A literal '<' or '>' in the text is not markup
+        ("<p>Precio: 5 < 10 euros, plazas > 3</p>", "Precio: 5 < 10 euros, plazas > 3"),
+    ], ids=['tags_and_entities', 'literal_angle_brackets'])
+    def test_small_page_skips_parser(self, html, expected):
+        """Test that tiny bodies are extracted without building a parse tree."""
+        from news_manager import web_extractor
+        with patch.object(web_extractor, 'BeautifulSoup') as mock_soup:
+            result = WebContentExtractor(use_selectolax=False)._parse_content(html)
+        assert result == expected
+        mock_soup.assert_not_called()
+
+    def test_scripts_are_ignored(self):
+        """Test that script contents are not part of the extracted text."""
+        result = WebContentExtractor()._parse_content(self.ARTICLE_HTML)
+        assert "tracking" not in result
+
+
 if __name__ == '__main__':
     pytest.main([__file__]) 
\ No newline at end of file
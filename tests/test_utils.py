@@ -4,12 +4,19 @@ from pathlib import Path
 import tempfile
 import os
 import logging
+from unittest.mock import MagicMock
 
 # Import the functions we want to test
 from news_manager.news_generator import slugify, extract_person_names, siguiente_laborable
 from news_manager.news_generator import NewsGenerator
 
 
+@pytest.fixture(autouse=True)
+def google_api_key(monkeypatch):
+    # NewsGenerator builds its Gemini client on creation; no request is made
+    monkeypatch.setenv('GOOGLE_API_KEY', 'test_key')
+
+
 class TestSlugify:
     """Test the slugify function."""
     
@@ -74,12 +81,24 @@ class TestExtractPersonNames:
         assert "Ana" in result or "Martínez" in result
         assert "Miguel" in result or "García" in result
     
+    def test_extract_names_folds_accents(self):
+        """Test that accented names are returned folded to ASCII."""
+        text = "La Dra. Begoña Martínez presenta su trabajo."
+        result = extract_person_names(text)
+        assert "Begona" in result
+        assert "Martinez" in result
+
     def test_extract_names_no_names(self):
         """Test extracting names when no names are present."""
         text = "This is a text without person names."
         result = extract_person_names(text)
         assert result == []
     
+    def test_extract_names_lowercase_text(self):
+        """Test that text without capital letters yields no names."""
+        result = extract_person_names("una noticia sin mayúsculas sobre el dr. ruiz")
+        assert result == []
+
     def test_extract_names_empty_text(self):
         """Test extracting names from empty text."""
         result = extract_person_names("")
@@ -181,6 +200,42 @@ Links:
         assert len(enlaces) == 1
         assert "- https://example.com" in enlaces
     
+    def test_parse_output_text_sections(self):
+        """Test that the text spans up to the next section, in any order."""
+        text = """Text: First paragraph.
+
+Second paragraph.
+Bluesky: A post.
+Title: Late Title"""
+
+        generator = NewsGenerator()
+        titulo, texto, bluesky, enlaces = generator._parse_output(text)
+
+        assert titulo == "Late Title"
+        assert texto == "First paragraph.\nSecond paragraph."
+        assert bluesky == "A post."
+        assert enlaces == []
+
+    def test_parse_output_crlf_and_indentation(self):
+        """Test that CRLF line endings and indentation are stripped from the text."""
+        text = "Title: T\r\nText: line1\r\n  line2 indented\r\nBluesky: Post\r\n"
+
+        generator = NewsGenerator()
+        titulo, texto, bluesky, enlaces = generator._parse_output(text)
+
+        assert titulo == "T"
+        assert texto == "line1\nline2 indented"
+        assert bluesky == "Post"
+
+    @pytest.mark.parametrize("sep", ["\r", "\v", "\f", "\x85", "\u2028", "\u2029"],
+                             ids=['cr', 'vt', 'ff', 'nel', 'line_sep', 'para_sep'])
+    def test_parse_output_other_line_breaks(self, sep):
+        """Test that every line break splitlines() knows separates sections."""
+        generator = NewsGenerator()
+        result = generator._parse_output(f"Title: A{sep}Text: B{sep}more{sep}Bluesky: C")
+
+        assert result == ("A", "B\nmore", "C", [])
+
     def test_parse_output_empty(self):
         """Test parsing empty output."""
         generator = NewsGenerator()
@@ -204,6 +259,175 @@ Links:
         assert enlaces == []
 
 
+class TestNewsGeneratorClients:
+    """Test how NewsGenerator creates its clients."""
+
+    def test_clients_created_on_init(self, monkeypatch):
+        """Test that clients are built when the generator is created."""
+        from news_manager import news_generator
+        mock_gemini = MagicMock()
+        monkeypatch.setattr(news_generator, 'GeminiClient', mock_gemini)
+
+        generator = NewsGenerator()
+        mock_gemini.assert_called_once()
+        assert generator.llm_client is mock_gemini.return_value
+
+    def test_missing_api_key_reported_on_init(self, monkeypatch):
+        """Test that a missing API key fails before any input is read."""
+        from news_manager.exceptions import ConfigurationError
+        monkeypatch.delenv('GOOGLE_API_KEY')
+        with pytest.raises(ConfigurationError, match="Google Gemini key not found"):
+            NewsGenerator()
+
+
+class TestBlueskyOnly:
+    """Test Bluesky-only generation for DIIS URLs."""
+
+    def test_prompt_ends_with_url(self):
+        """Test that the Bluesky prompt is specialized with the source URL."""
+        url = "https://diis.unizar.es/noticias/test"
+        generator = NewsGenerator()
+        generator.llm_client = MagicMock()
+        generator.llm_client.generate_news.return_value = "Bluesky: Post [link to the news]"
+
+        result = generator._generate_bluesky_only("Some content", url)
+
+        _, bluesky_prompt, _ = generator.llm_client.generate_news.call_args[0]
+        assert bluesky_prompt.endswith(f"ending with the link to the news: {url}")
+        assert result['bluesky'] == f"Post {url}"
+        assert result['bluesky_only'] is True
+
+
+class TestReadFileContent:
+    """Test the fused file validation and read."""
+
+    def test_read_valid_file(self, tmp_path):
+        """Test that a valid file is read and stripped."""
+        file_path = tmp_path / "noticia.txt"
+        file_path.write_text("  Test content for news generation.  \n", encoding='utf-8')
+
+        generator = NewsGenerator()
+        assert generator._read_file_content(file_path) == "Test content for news generation."
+
+    def test_read_missing_file(self, tmp_path):
+        """Test that a missing file is reported."""
+        from news_manager.exceptions import ContentProcessingError
+        generator = NewsGenerator()
+        with pytest.raises(ContentProcessingError, match="File does not exist"):
+            generator._read_file_content(tmp_path / "missing.txt")
+
+    def test_read_directory(self, tmp_path):
+        """Test that a directory is rejected."""
+        from news_manager.exceptions import ContentProcessingError
+        generator = NewsGenerator()
+        with pytest.raises(ContentProcessingError, match="Path is not a file"):
+            generator._read_file_content(tmp_path)
+
+    @pytest.mark.skipif(not hasattr(os, 'mkfifo'), reason="requires named pipes")
+    def test_read_fifo(self, tmp_path):
+        """Test that a named pipe is rejected without blocking on open."""
+        from news_manager.exceptions import ContentProcessingError
+        fifo_path = tmp_path / "noticia.fifo"
+        os.mkfifo(fifo_path)
+        generator = NewsGenerator()
+        with pytest.raises(ContentProcessingError, match="Path is not a file"):
+            generator._read_file_content(fifo_path)
+
+    def test_read_short_file(self, tmp_path):
+        """Test that too short content is rejected."""
+        from news_manager.exceptions import ContentProcessingError
+        file_path = tmp_path / "short.txt"
+        file_path.write_text("short", encoding='utf-8')
+
+        generator = NewsGenerator()
+        with pytest.raises(ContentProcessingError, match="File content too short"):
+            generator._read_file_content(file_path)
+
+    def test_read_non_utf8_file(self, tmp_path):
+        """Test that non-UTF-8 content is rejected."""
+        from news_manager.exceptions import ContentProcessingError
+        file_path = tmp_path / "latin1.txt"
+        file_path.write_bytes("Contenido en codificación latina".encode('latin-1'))
+
+        generator = NewsGenerator()
+        with pytest.raises(ContentProcessingError, match="not a valid text file"):
+            generator._read_file_content(file_path)
+
+
+class TestSelectFromList:
+    """Test the select_from_list function."""
+
+    def test_select_by_index(self, monkeypatch):
+        """Test selecting an option by its number."""
+        from news_manager.utils import select_from_list
+        monkeypatch.setattr('builtins.input', lambda _: "1")
+        assert select_from_list(["First", "Second"]) == (1, "Second")
+
+    def test_menu_is_printed(self, monkeypatch, capsys):
+        """Test that every option is listed with its number."""
+        from news_manager.utils import select_from_list
+        monkeypatch.setattr('builtins.input', lambda _: "0")
+        select_from_list(["First", "Second"])
+        assert capsys.readouterr().out == "0) First\n1) Second\n"
+
+    def test_select_by_substring(self, monkeypatch):
+        """Test case-insensitive substring selection."""
+        from news_manager.utils import select_from_list
+        monkeypatch.setattr('builtins.input', lambda _: "SEC")
+        assert select_from_list(["First", "Second"]) == (1, "Second")
+
+    def test_select_url(self, monkeypatch):
+        """Test that a URL is returned as the last option."""
+        from news_manager.utils import select_from_list
+        monkeypatch.setattr('builtins.input', lambda _: "https://example.com/news")
+        assert select_from_list(["Email", "Web"]) == (1, "https://example.com/news")
+
+    def test_select_text_starting_with_digit(self, monkeypatch):
+        """Test that text starting with a digit is matched as a substring."""
+        from news_manager.utils import select_from_list
+        monkeypatch.setattr('builtins.input', lambda _: "2025 seminar")
+        assert select_from_list(["News", "The 2025 Seminar"]) == (1, "The 2025 Seminar")
+
+    def test_select_retries_until_match(self, monkeypatch):
+        """Test that an invalid selection asks again."""
+        from news_manager.utils import select_from_list
+        answers = iter(["nothing", "fir"])
+        monkeypatch.setattr('builtins.input', lambda _: next(answers))
+        assert select_from_list(["First", "Second"]) == (0, "First")
+
+    def test_select_cancelled(self, monkeypatch):
+        """Test that EOF cancels the selection."""
+        from news_manager.utils import select_from_list
+
+        def raise_eof(_):
+            raise EOFError
+
+        monkeypatch.setattr('builtins.input', raise_eof)
+        assert select_from_list(["First", "Second"]) == (None, None)
+
+
+class TestRulesCache:
+    """Test the moduleRules cache used by select_news_source."""
+
+    def test_rules_built_once(self, monkeypatch):
+        """Test that moduleRules is only instantiated once per process."""
+        from news_manager import utils
+
+        mock_module = MagicMock()
+        monkeypatch.setattr(utils, 'moduleRules', mock_module, raising=False)
+        monkeypatch.setattr(utils, '_RULES_CACHE', None)
+        monkeypatch.setattr(utils, '_SELECTED_RULES_CACHE', {})
+
+        rules = utils._get_rules()
+        assert utils._get_rules() is rules
+        mock_module.moduleRules.assert_called_once()
+        rules.checkRules.assert_called_once()
+
+        utils._select_rules(rules, ["gmail", "imap"])
+        utils._select_rules(rules, ["gmail", "imap"])
+        rules.selectRule.assert_called_once_with(["gmail", "imap"], "")
+
+
 class TestFileOperations:
     """Test file operations and CLI functionality."""
     
@@ -249,6 +473,22 @@ class TestWriteFile(object):
         write_file("/non/existent/path", "test content")
         assert "Error writing file" in caplog.text
 
+    def test_write_file_unicode(self, tmp_path):
+        """Test that non-ASCII content is written as UTF-8."""
+        from news_manager.utils_base import write_file
+        temp_file = tmp_path / "noticia.txt"
+        write_file(str(temp_file), "Lectura de Tesis de María Núñez")
+        assert temp_file.read_text(encoding='utf-8') == "Lectura de Tesis de María Núñez"
+
+    def test_write_files(self, tmp_path):
+        """Test that several files are written in one call."""
+        from news_manager.utils_base import write_files
+        pairs = [(str(tmp_path / f"file{i}.txt"), f"content {i}") for i in range(5)]
+        write_files(pairs)
+        for filename, content in pairs:
+            with open(filename, 'r') as f:
+                assert f.read() == content
+
 
 class TestSetupLogging(object):
     """Test the setup_logging function."""
@@ -0,0 +1,160 @@
+import os
+import pytest
+import requests
+from unittest.mock import Mock, patch
+
+from news_manager.validators import InputValidator, _probe_url
+from news_manager.exceptions import ConfigurationError, ValidationError
+
+
+class TestValidateApiKey:
+    """Test the validate_api_key method."""
+
+    def test_valid_key(self):
+        """Test that a well-formed key is accepted."""
+        InputValidator.validate_api_key("AIza_valid-key123", "Google Gemini")
+
+    def test_valid_key_with_surrounding_whitespace(self):
+        """Test that surrounding whitespace is ignored."""
+        InputValidator.validate_api_key("  AIza_valid-key123\n", "Google Gemini")
+
+    def test_missing_key(self):
+        """Test that a missing key is rejected."""
+        with pytest.raises(ConfigurationError, match="Google Gemini key not found"):
+            InputValidator.validate_api_key(None, "Google Gemini")
+
+    def test_short_key(self):
+        """Test that a too short key is rejected."""
+        with pytest.raises(ConfigurationError, match="key too short"):
+            InputValidator.validate_api_key("  abc  ", "Google Gemini")
+
+    def test_invalid_characters(self):
+        """Test that keys with invalid characters are rejected."""
+        with pytest.raises(ConfigurationError, match="Invalid Google Gemini key format"):
+            InputValidator.validate_api_key("abc def ghi", "Google Gemini")
+
+
+class TestValidateFilePath:
+    """Test the file validation methods."""
+
+    def test_readable_file(self, tmp_path):
+        """Test that an existing readable file is accepted."""
+        file_path = tmp_path / "noticia.txt"
+        file_path.write_text("Contenido de prueba", encoding='utf-8')
+        InputValidator.validate_file_path(file_path)
+
+    def test_missing_file(self, tmp_path):
+        """Test that a missing file is rejected."""
+        with pytest.raises(ValidationError, match="File does not exist"):
+            InputValidator.validate_file_path(tmp_path / "missing.txt")
+
+    def test_directory(self, tmp_path):
+        """Test that a directory is rejected."""
+        with pytest.raises(ValidationError, match="Path is not a file"):
+            InputValidator.validate_file_path(tmp_path)
+
+    def test_unreadable_file(self, tmp_path, monkeypatch):
+        """Test that a file without read permission is rejected."""
+        file_path = tmp_path / "secret.txt"
+        file_path.write_text("Contenido de prueba", encoding='utf-8')
+        monkeypatch.setattr(os, 'access', lambda path, mode: False)
+        with pytest.raises(ValidationError, match="No permission to read file"):
+            InputValidator.validate_file_path(file_path)
+
+    def test_encoding_not_checked_by_path_validation(self, tmp_path):
+        """Test that path validation does not read the file content."""
+        file_path = tmp_path / "latin1.txt"
+        file_path.write_bytes("codificación".encode('latin-1'))
+        InputValidator.validate_file_path(file_path)
+
+    def test_invalid_encoding(self, tmp_path):
+        """Test that non-UTF-8 files are rejected by the encoding check."""
+        file_path = tmp_path / "latin1.txt"
+        file_path.write_bytes("codificación".encode('latin-1'))
+        with pytest.raises(ValidationError, match="not a valid text file"):
+            InputValidator.validate_file_encoding(file_path)
+        with pytest.raises(ValidationError, match="not a valid text file"):
+            InputValidator.validate_file_content(file_path)
+
+
+class TestValidateDirectoryPath:
+    """Test the validate_directory_path method."""
+
+    def test_existing_directory(self, tmp_path):
+        """Test that an existing directory is accepted."""
+        InputValidator.validate_directory_path(tmp_path)
+
+    def test_file_instead_of_directory(self, tmp_path):
+        """Test that a regular file is rejected."""
+        file_path = tmp_path / "file.txt"
+        file_path.write_text("content", encoding='utf-8')
+        with pytest.raises(ValidationError, match="not a directory"):
+            InputValidator.validate_directory_path(file_path)
+
+    def test_missing_directory(self, tmp_path):
+        """Test that a missing directory is rejected unless it can be created."""
+        missing = tmp_path / "a" / "b"
+        with pytest.raises(ValidationError, match="Directory does not exist"):
+            InputValidator.validate_directory_path(missing)
+        InputValidator.validate_directory_path(missing, create_if_missing=True)
+        assert missing.is_dir()
+
+
+class TestValidatePromptExtra:
+    """Test the validate_prompt_extra method."""
+
+    def test_none_is_allowed(self):
+        """Test that a missing prompt is accepted."""
+        InputValidator.validate_prompt_extra(None)
+
+    def test_valid_prompt(self):
+        """Test that meaningful instructions are accepted."""
+        InputValidator.validate_prompt_extra("focus on the technological aspects")
+
+    @pytest.mark.parametrize("prompt", ["", "   ", "none", " None ", "NULL"])
+    def test_placeholder_values_rejected(self, prompt):
+        """Test that empty and placeholder prompts are rejected."""
+        with pytest.raises(ValidationError, match="Invalid prompt content"):
+            InputValidator.validate_prompt_extra(prompt)
+
+    def test_too_long(self):
+        """Test that prompts over the maximum length are rejected."""
+        with pytest.raises(ValidationError, match="Prompt too long"):
+            InputValidator.validate_prompt_extra("x" * 11, max_length=10)
+
+
+class TestValidateUrlAccessibility:
+    """Test the cached accessibility check of validate_url."""
+
+    def setup_method(self):
+        _probe_url.cache_clear()
+
+    @patch('news_manager.web_extractor.requests.Session.head')
+    def test_repeated_probes_are_cached(self, mock_head):
+        """Test that validating the same URL twice sends a single HEAD."""
+        mock_head.return_value = Mock(status_code=200)
+        InputValidator.validate_url("https://example.com/feed", check_accessibility=True)
+        InputValidator.validate_url("https://example.com/feed", check_accessibility=True)
+        mock_head.assert_called_once()
+
+    @patch('news_manager.web_extractor.requests.Session.head')
+    def test_error_status_is_rejected(self, mock_head):
+        """Test that an HTTP error status is reported, also from the cache."""
+        mock_head.return_value = Mock(status_code=404)
+        for _ in range(2):
+            with pytest.raises(ValidationError, match="URL not accessible"):
+                InputValidator.validate_url("https://example.com/missing", check_accessibility=True)
+        mock_head.assert_called_once()
+
+    @patch('news_manager.web_extractor.requests.Session.head')
+    def test_network_errors_are_not_cached(self, mock_head):
+        """Test that a failed probe is retried on the next validation."""
+        mock_head.side_effect = [requests.ConnectionError("down"), Mock(status_code=200)]
+        with pytest.raises(ValidationError, match="Cannot access URL"):
+            InputValidator.validate_url("https://example.com/flaky", check_accessibility=True)
+        InputValidator.validate_url("https://example.com/flaky", check_accessibility=True)
+        assert mock_head.call_count == 2
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])